@@ -1,4 +1,9 @@
+import asyncio
 import io
+import json
+import math
+import queue
+import threading
 import time
 import warnings
 from datetime import datetime
@@ -6,11 +11,127 @@ from typing import Dict, Union
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from tabulate import tabulate
 from termcolor import colored
+from urllib3.util import Retry
 
 from gridstatusio import __version__, utils
 
+try:
+    # orjson is a C-based JSON parser that is significantly faster than the
+    # stdlib for the multi-MB payloads returned by paginated dataset queries
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # pyarrow's CSV reader parses in parallel and types timestamp columns
+    # natively, which is substantially faster than pandas' parser on
+    # large pages
+    import pyarrow
+    from pyarrow import csv as pyarrow_csv
+except ImportError:
+    pyarrow = None
+    pyarrow_csv = None
+
+
+def _accept_encoding():
+    """Build the Accept-Encoding header value, only advertising encodings
+    urllib3 can actually decode. zstd compresses the large dataset payloads
+    better than gzip and decodes faster, but urllib3 only supports it when
+    the zstandard package is installed."""
+    encodings = []
+    try:
+        import zstandard  # noqa: F401
+
+        encodings.append("zstd")
+    except ImportError:
+        pass
+    encodings.extend(["gzip", "deflate"])
+    return ", ".join(encodings)
+
+
+_ACCEPT_ENCODING = _accept_encoding()
+
+
+def _parse_json(content):
+    """Parse raw response bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _read_csv(content, dtype_backend=None):
+    """Parse raw CSV response bytes into a DataFrame, using pyarrow
+    when available"""
+    if pyarrow_csv is not None:
+        table = pyarrow_csv.read_csv(pyarrow.BufferReader(content))
+        if dtype_backend == "pyarrow":
+            # Keep the Arrow buffers instead of copying into numpy arrays
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        return table.to_pandas()
+    if dtype_backend is not None:
+        return pd.read_csv(
+            io.BytesIO(content),
+            low_memory=False,
+            dtype_backend=dtype_backend,
+        )
+    return pd.read_csv(io.BytesIO(content), low_memory=False)
+
+
+def _rows_to_page(rows, columns):
+    """Convert one page of row lists into a pyarrow Table so the page's
+    Python row objects can be released as soon as it is parsed, rather
+    than every page's rows staying alive until the final DataFrame is
+    built. Returns the raw rows unchanged when pyarrow is unavailable or
+    cannot represent the values; the caller assembles either form."""
+    if pyarrow is None or not rows:
+        return rows
+
+    # Ragged rows would be silently truncated by the zip below; let
+    # pandas pad them instead
+    if any(len(row) != len(columns) for row in rows):
+        return rows
+
+    try:
+        arrays = [pyarrow.array(values) for values in zip(*rows)]
+        return pyarrow.Table.from_arrays(arrays, names=columns)
+    except pyarrow.ArrowException:
+        # e.g. a column mixes types pyarrow can't reconcile
+        return rows
+
+
+def _pages_to_dataframe(pages, columns):
+    """Build a single DataFrame from per-page results, each either a
+    pyarrow Table from `_rows_to_page` or a list of raw rows"""
+    frames = []
+    tables = []
+
+    def flush_tables():
+        if tables:
+            frames.append(
+                pyarrow.concat_tables(
+                    tables,
+                    promote_options="permissive",
+                ).to_pandas(),
+            )
+            tables.clear()
+
+    for page in pages:
+        if pyarrow is not None and isinstance(page, pyarrow.Table):
+            tables.append(page)
+        elif len(page):
+            flush_tables()
+            frames.append(pd.DataFrame(page, columns=columns))
+    flush_tables()
+
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
 
 def log(msg, verbose, level="info", end="\n"):
     """Print a message if verbose matches the level"""
@@ -31,6 +152,9 @@ class GridStatusClient:
         host="https://api.gridstatus.io/v1",
         request_format="json",
         max_retries=3,
+        max_requests_per_second=None,
+        catalog_cache_ttl=300,
+        use_http2=False,
     ):
         """Create a GridStatus.io API client
 
@@ -46,6 +170,22 @@ class GridStatusClient:
 
             max_retries (int): The maximum number of retries to attempt if an API rate
                 limit is hit when requesting data. Defaults to 3.
+
+            max_requests_per_second (float): If set, the client spaces out requests
+                so at most this many are started per second, avoiding 429 responses
+                and their retry delays. Defaults to None, which does not limit
+                the request rate.
+
+            catalog_cache_ttl (float): How long, in seconds, to cache the dataset
+                catalog used by `list_datasets`. The catalog changes rarely, so
+                caching avoids re-fetching and re-parsing it on repeated calls.
+                Set to 0 to disable caching. Defaults to 300.
+
+            use_http2 (bool): If set to True, requests are made with httpx over
+                HTTP/2, which multiplexes concurrent requests onto a single
+                connection instead of one connection per request. Requires the
+                httpx package (`pip install gridstatusio[http2]`). Defaults to
+                False, which uses requests over HTTP/1.1.
         """
 
         if api_key is None:
@@ -64,26 +204,160 @@ class GridStatusClient:
         self.host = host
         self.request_format = request_format
         self.max_retries = max_retries
+        self.max_requests_per_second = max_requests_per_second
+
+        self._request_interval = (
+            1 / max_requests_per_second if max_requests_per_second else 0
+        )
+        self._last_request_time = 0.0
+        self._throttle_lock = threading.Lock()
+
+        self.catalog_cache_ttl = catalog_cache_ttl
+        # Maps url -> (fetch time, result) for catalog endpoints
+        self._catalog_cache = {}
 
         assert self.request_format in [
             "json",
             "csv",
         ], "request_format must be 'json' or 'csv'"
 
+        # Reuse a single session so keep-alive connections are shared across
+        # requests instead of opening a new TCP/TLS connection per page.
+        # Connection-level errors and transient server errors are retried at
+        # the urllib3 layer; 429s are handled in get() so we can log retries.
+        if use_http2:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError(
+                    "httpx is required for use_http2. "
+                    "Install it with `pip install gridstatusio[http2]`.",
+                )
+
+            # httpx exposes the same get()/response interface the client
+            # uses. Its transport retries cover connection errors only;
+            # 429s are still handled in get(). The default 5 second timeout
+            # is disabled to match requests' behavior on long queries.
+            # http2 must be set on the transport: an explicit transport
+            # overrides the client-level flag, which would silently leave
+            # the connection pool on HTTP/1.1.
+            self.session = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    retries=self.max_retries,
+                    http2=True,
+                ),
+                timeout=None,
+            )
+            self._transport_errors = (httpx.TransportError,)
+        else:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(
+                max_retries=Retry(
+                    total=self.max_retries,
+                    backoff_factor=1,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=["GET"],
+                ),
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self._transport_errors = (requests.exceptions.RequestException,)
+
     def __repr__(self) -> str:
         return f"GridStatusClient(host={self.host})"
 
-    def get(self, url, params=None, verbose=False, return_raw_response_json=False):
-        if params is None:
-            params = {}
-
-        headers = {
+    def _headers(self):
+        return {
             "x-api-key": self.api_key,
             # set client and version
             "x-client": "gridstatusio-python",
             "x-client-version": __version__,
         }
 
+    def _reserve_request_slot(self):
+        """Return how many seconds to wait before starting the next request
+        so the request rate stays under max_requests_per_second. The slot is
+        claimed immediately, so concurrent callers are spaced out."""
+        if not self._request_interval:
+            return 0
+
+        with self._throttle_lock:
+            now = time.monotonic()
+            scheduled = max(now, self._last_request_time + self._request_interval)
+            self._last_request_time = scheduled
+            return scheduled - now
+
+    def _build_dataset_params(
+        self,
+        start,
+        end,
+        columns,
+        filter_column,
+        filter_value,
+        filter_operator,
+        publish_time,
+        resample,
+        resample_by,
+        resample_function,
+        limit,
+        page_size,
+        timezone,
+        page,
+    ):
+        """Build the query parameters for a single page of a dataset query"""
+        params = {
+            "start_time": start,
+            "end_time": end,
+            "limit": limit,
+            "page": page,
+            "page_size": page_size,
+            "resample_frequency": resample,
+            "resample_by": (",".join(resample_by) if resample_by is not None else None),
+            "resample_function": resample_function if resample else None,
+            "publish_time": publish_time,
+            "timezone": timezone,
+        }
+
+        # todo test this conditional
+        if filter_column is not None or filter_value != "":
+            if isinstance(filter_value, list) and filter_operator == "in":
+                filter_value = ",".join(filter_value)
+
+            params["filter_column"] = filter_column
+            params["filter_value"] = filter_value
+            params["filter_operator"] = filter_operator
+
+        if columns is not None:
+            params["columns"] = ",".join(columns)
+
+        return params
+
+    def _retry_delay(self, response, retries, initial_delay=1):
+        """How long to wait before retrying a rate-limited request, honoring
+        the server's Retry-After header when present instead of guessing
+        with exponential backoff"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0)
+            except ValueError:
+                pass
+
+        # Exponential backoff delay of 1 sec, 2 sec, 4 sec...
+        return initial_delay * 2**retries
+
+    def _request(self, url, params=None, verbose=False, headers=None):
+        """Issue a GET request with rate limiting and 429 retries, returning
+        the raw response"""
+        if params is None:
+            params = {}
+
+        extra_headers = headers
+        headers = self._headers()
+        headers["Accept-Encoding"] = _ACCEPT_ENCODING
+        if extra_headers:
+            headers.update(extra_headers)
+
         # note
         # parameter name different for API
         # than for python client
@@ -93,20 +367,30 @@ class GridStatusClient:
             if self.request_format == "json":
                 params["json_schema"] = "array-of-arrays"
 
+        # requests drops None-valued params on its own; filter them here so
+        # the httpx backend behaves the same way
+        params = {k: v for k, v in params.items() if v is not None}
+
         log(f"\nGET {url}", verbose=verbose, level="debug")
         log(f"Params: {params}", verbose=verbose, level="debug")
 
         retries = 0
         initial_delay = 1
         while retries <= self.max_retries:
-            response = requests.get(url, params=params, headers=headers)
+            wait = self._reserve_request_slot()
+            if wait > 0:
+                time.sleep(wait)
+            response = self.session.get(url, params=params, headers=headers)
             if response.status_code == 200:
                 break
+            elif response.status_code == 304:
+                # Not Modified, only possible when the caller sent a
+                # conditional request header like If-None-Match
+                break
             elif (response.status_code == 429) and (retries == self.max_retries):
                 raise Exception("Rate limited. Exceeded maximum number of retries")
             elif response.status_code == 429:
-                # Exponential backoff delay of 1 sec, 2 sec, 4 sec...
-                delay = initial_delay * 2**retries
+                delay = self._retry_delay(response, retries, initial_delay)
                 retries += 1
                 log(
                     (
@@ -120,22 +404,97 @@ class GridStatusClient:
             else:
                 raise Exception(f"Error {response.status_code}: {response.text}")
 
+        return response
+
+    def get(
+        self,
+        url,
+        params=None,
+        verbose=False,
+        return_raw_response_json=False,
+        raw=False,
+    ):
+        """Make a GET request to the API
+
+        When `raw` is True and the request format is "json", returns the
+        raw row lists and column names instead of a DataFrame. When the
+        request format is "csv", returns the raw response bytes. This lets
+        `get_dataset` accumulate raw pages and build a single DataFrame at
+        the end rather than one per page.
+        """
+        response = self._request(url, params=params, verbose=verbose)
+
         if return_raw_response_json:
-            return response.json()
+            return _parse_json(response.content)
+
+        return self._parse_response(response, raw=raw)
 
+    def _parse_response(self, response, raw=False):
+        """Parse a raw API response according to the client's request format"""
         meta = None
         dataset_metadata = None
 
         if self.request_format == "json":
-            data = response.json()
-            df = pd.DataFrame(data["data"][1:], columns=data["data"][0])
+            data = _parse_json(response.content)
             meta = data["meta"]
             dataset_metadata = data["dataset_metadata"]
+            if raw:
+                return data["data"][1:], data["data"][0], meta, dataset_metadata
+            df = pd.DataFrame(data["data"][1:], columns=data["data"][0])
         elif self.request_format == "csv":
-            df = pd.read_csv(io.StringIO(response.text), low_memory=False)
+            if raw:
+                return response.content, meta, dataset_metadata
+            df = _read_csv(response.content)
 
         return df, meta, dataset_metadata
 
+    def _get_catalog(self, url, verbose=False):
+        """Fetch a catalog endpoint, serving from the client's cache when the
+        cached copy is younger than catalog_cache_ttl. Once the TTL expires,
+        revalidate with If-None-Match so an unchanged catalog costs a 304
+        with no body instead of a full fetch and re-parse. If the API is
+        unreachable and a stale cached copy exists, the stale copy is
+        returned rather than failing."""
+        cached = self._catalog_cache.get(url)
+        if (
+            cached is not None
+            and time.monotonic() - cached["time"] < self.catalog_cache_ttl
+        ):
+            return cached["result"]
+
+        conditional_headers = None
+        if cached is not None and cached.get("etag"):
+            conditional_headers = {"If-None-Match": cached["etag"]}
+
+        try:
+            response = self._request(
+                url,
+                verbose=verbose,
+                headers=conditional_headers,
+            )
+        except self._transport_errors as e:
+            if cached is not None:
+                warnings.warn(
+                    f"Could not reach the API ({e}). "
+                    "Returning a previously cached copy of the catalog.",
+                    stacklevel=2,
+                )
+                return cached["result"]
+            raise
+
+        if response.status_code == 304:
+            # Not modified; keep serving the cached copy for another TTL
+            cached["time"] = time.monotonic()
+            return cached["result"]
+
+        result = self._parse_response(response)
+        self._catalog_cache[url] = {
+            "time": time.monotonic(),
+            "result": result,
+            "etag": response.headers.get("ETag"),
+        }
+        return result
+
     def list_datasets(self, filter_term=None, return_list=False):
         """List available datasets from the API,
         with optional filter and return list option.
@@ -152,65 +511,71 @@ class GridStatusClient:
         """
         url = f"{self.host}/datasets/"
 
-        df, _meta, _dataset_metadata = self.get(url)
+        df, _meta, _dataset_metadata = self._get_catalog(url)
+
+        if filter_term is not None:
+            # Vectorized, case-insensitive substring match across id, name,
+            # and description instead of a per-row Python loop
+            mask = (
+                df["id"].str.contains(filter_term, case=False, regex=False)
+                | df["name"].str.contains(filter_term, case=False, regex=False)
+                | df["description"]
+                .fillna("")
+                .str.contains(filter_term, case=False, regex=False)
+            )
+            df = df[mask]
+
+        matched_datasets = df.to_dict("records")
+
+        if not return_list:
+            # Render all tables into one string and write it in a single log
+            # call instead of flushing the terminal once per dataset
+            tables = []
+            for dataset in matched_datasets:
+                dataset_description = dataset.get("description", "")
+                if dataset_description is None:
+                    dataset_description = ""
+
+                headers = ["Key", "Value"]
+                dataset_table = [
+                    ["Name", colored(dataset["name"], "cyan", attrs=["bold"])],
+                    ["ID", colored(dataset["id"], "yellow")],
+                    ["Description", colored(dataset_description, "green")],
+                    [
+                        "Earliest available time",
+                        colored(dataset["earliest_available_time"], "blue"),
+                    ],
+                    [
+                        "Latest available time",
+                        colored(dataset["latest_available_time"], "blue"),
+                    ],
+                ]
+
+                num_rows = dataset.get("num_rows")
+                all_columns = [col["name"] for col in dataset.get("all_columns", [])]
+
+                if num_rows is not None:
+                    dataset_table.append(
+                        ["Number of rows", colored(num_rows, "red")],
+                    )
+                if all_columns:
+                    dataset_table.append(
+                        ["Available columns", ", ".join(all_columns)],
+                    )
+                else:
+                    dataset_table.append(
+                        ["Available columns", "No available columns information."],
+                    )
 
-        matched_datasets = []
+                more_info_url = f"https://www.gridstatus.io/datasets/{dataset['id']}"
+                dataset_table.append(["More Info", more_info_url])
 
-        for dataset in df.to_dict("records"):
-            dataset_description = dataset.get("description", "")
-            if dataset_description is None:
-                dataset_description = ""
-            if filter_term is None or (
-                filter_term.lower() in dataset["id"].lower()
-                or filter_term.lower() in dataset["name"].lower()
-                or filter_term.lower() in dataset_description.lower()
-            ):
-                matched_datasets.append(dataset)
-
-                if not return_list:
-                    headers = ["Key", "Value"]
-                    dataset_table = [
-                        ["Name", colored(dataset["name"], "cyan", attrs=["bold"])],
-                        ["ID", colored(dataset["id"], "yellow")],
-                        ["Description", colored(dataset_description, "green")],
-                        [
-                            "Earliest available time",
-                            colored(dataset["earliest_available_time"], "blue"),
-                        ],
-                        [
-                            "Latest available time",
-                            colored(dataset["latest_available_time"], "blue"),
-                        ],
-                    ]
-
-                    num_rows = dataset.get("num_rows")
-                    all_columns = [
-                        col["name"] for col in dataset.get("all_columns", [])
-                    ]
-
-                    if num_rows is not None:
-                        dataset_table.append(
-                            ["Number of rows", colored(num_rows, "red")],
-                        )
-                    if all_columns:
-                        dataset_table.append(
-                            ["Available columns", ", ".join(all_columns)],
-                        )
-                    else:
-                        dataset_table.append(
-                            ["Available columns", "No available columns information."],
-                        )
-
-                    more_info_url = (
-                        f"https://www.gridstatus.io/datasets/{dataset['id']}"
-                    )
-                    dataset_table.append(["More Info", more_info_url])
+                tables.append(
+                    tabulate(dataset_table, headers=headers, tablefmt="pretty"),
+                )
 
-                    log(
-                        tabulate(dataset_table, headers=headers, tablefmt="pretty"),
-                        True,
-                    )
-                    log("\n", True)
+            if tables:
+                log("\n\n\n".join(tables) + "\n\n", True)
 
         if return_list:
             return matched_datasets
@@ -235,6 +600,9 @@ class GridStatusClient:
         verbose=True,
         use_cursor_pagination=True,
         sleep_time=0,
+        use_categories=False,
+        dtype_backend=None,
+        request_format=None,
     ):
         """Get a dataset from GridStatus.io API
 
@@ -308,6 +676,25 @@ class GridStatusClient:
                 when requesting multiple pages of data. Can be used to slow request
                 frequency to help avoid hitting API rate limits. Defaults to 0.
 
+            use_categories (bool): If set to True, string columns where values
+                repeat are returned as pandas categoricals, which store each
+                distinct value once and can cut the memory footprint of large
+                results substantially. Defaults to False.
+
+            dtype_backend (str): The dtype backend for the returned DataFrame.
+                Options are "numpy_nullable" and "pyarrow". "pyarrow" backs
+                string columns with Arrow buffers instead of Python objects,
+                which uses far less memory on string-heavy datasets. Defaults
+                to None, which returns numpy-backed columns.
+
+            request_format (str): Overrides the client-level request format
+                for this call. "csv" skips JSON decoding entirely and goes
+                through the CSV parser, which is faster for large pulls, but
+                the csv responses carry no pagination metadata so the result
+                is limited to a single response; size it with limit or
+                page_size. Defaults to None, which uses the client's
+                request_format.
+
         Returns:
             pd.DataFrame: The dataset as a pandas dataframe
         """
@@ -320,6 +707,14 @@ class GridStatusClient:
             if timezone:
                 raise ValueError("'tz' and 'timezone' parameters cannot both be set.")
 
+        if request_format is None:
+            request_format = self.request_format
+
+        assert request_format in [
+            "json",
+            "csv",
+        ], "request_format must be 'json' or 'csv'"
+
         if start is not None:
             start = utils.handle_date(start, tz)
 
@@ -329,7 +724,14 @@ class GridStatusClient:
         # handle pagination
         page = 1
         has_next_page = True
-        dfs = []
+        # Accumulate the raw pages and build a single DataFrame at the end.
+        # This avoids creating one DataFrame per page plus the final concat
+        # copy, and for csv amortizes the parser setup across all pages.
+        # Each json page is converted to an Arrow table as it arrives so its
+        # Python row objects don't stay alive until the end.
+        pages = []
+        result_columns = None
+        csv_chunks = []
         total_time = 0
         total_rows = 0
 
@@ -340,53 +742,140 @@ class GridStatusClient:
         # This will be the same for all pages
         dataset_metadata = None
 
+        url = f"{self.host}/datasets/{dataset}/query"
+
+        # Everything but the page number is the same for all pages, so
+        # serialize the params once and copy them per request instead of
+        # re-joining the list-valued params each page
+        base_params = self._build_dataset_params(
+            start=start,
+            end=end,
+            columns=columns,
+            filter_column=filter_column,
+            filter_value=filter_value,
+            filter_operator=filter_operator,
+            publish_time=publish_time,
+            resample=resample,
+            resample_by=resample_by,
+            resample_function=resample_function,
+            limit=limit,
+            page_size=page_size,
+            timezone=timezone,
+            page=None,
+        )
+
+        # The request format may be overridden per call, so set it here
+        # rather than letting _request default to the client-level format
+        base_params["return_format"] = request_format
+        if request_format == "json":
+            base_params["json_schema"] = "array-of-arrays"
+
+        def build_params(page):
+            params = base_params.copy()
+            params["page"] = page
+            return params
+
+        # Once the total page count is known, a producer thread fetches the
+        # remaining pages into this queue while this thread parses them, so
+        # network time and parse time overlap instead of alternating
+        pipeline_queue = None
+        # Enqueued by the producer after its last page so the consumer never
+        # blocks waiting for a page the producer was never asked to fetch
+        pipeline_done = object()
+
+        def produce_pages(first_page, last_page):
+            try:
+                for producer_page in range(first_page, last_page + 1):
+                    pipeline_queue.put(
+                        self._request(
+                            url,
+                            params=build_params(page=producer_page),
+                            verbose=verbose,
+                        ),
+                    )
+                    if sleep_time:
+                        time.sleep(sleep_time)
+                pipeline_queue.put(pipeline_done)
+            except Exception as exc:
+                # Hand the exception to the consumer to re-raise
+                pipeline_queue.put(exc)
+
         while has_next_page:
             start_time = time.time()
 
-            params = {
-                "start_time": start,
-                "end_time": end,
-                "limit": limit,
-                "page": page,
-                "page_size": page_size,
-                "resample_frequency": resample,
-                "resample_by": (
-                    ",".join(resample_by) if resample_by is not None else None
-                ),
-                "resample_function": resample_function if resample else None,
-                "publish_time": publish_time,
-                "timezone": timezone,
-            }
-
-            # Setting the cursor value in the parameters tells the server to use
-            # cursor pagination.
-            if use_cursor_pagination:
-                params["cursor"] = cursor
-
-            url = f"{self.host}/datasets/{dataset}/query"
-            # todo test this conditional
-            if filter_column is not None or filter_value != "":
-                if isinstance(filter_value, list) and filter_operator == "in":
-                    filter_value = ",".join(filter_value)
-
-                params["filter_column"] = filter_column
-                params["filter_value"] = filter_value
-                params["filter_operator"] = filter_operator
-
-            if columns is not None:
-                params["columns"] = ",".join(columns)
-
             # Log the fetching message
             log(f"Fetching Page {page}...", verbose, end="")
 
-            df, meta, dataset_metadata = self.get(url, params=params, verbose=verbose)
+            if pipeline_queue is not None:
+                response = pipeline_queue.get()
+                if isinstance(response, Exception):
+                    raise response
+                if response is pipeline_done:
+                    # The producer fetched through the page count reported
+                    # by page 1, but the dataset grew in the meantime and
+                    # the last page still reports more data. Leave pipelined
+                    # mode and fetch the remaining pages directly (a new
+                    # pipeline is started below if a fresh page count is
+                    # reported).
+                    pipeline_queue = None
+                    response = self._request(
+                        url,
+                        params=build_params(page=page),
+                        verbose=verbose,
+                    )
+            else:
+                params = build_params(page=page)
+
+                # Setting the cursor value in the parameters tells the server
+                # to use cursor pagination.
+                if use_cursor_pagination:
+                    params["cursor"] = cursor
+
+                response = self._request(url, params=params, verbose=verbose)
+
+            if request_format == "json":
+                data = _parse_json(response.content)
+                meta = data["meta"]
+                dataset_metadata = data["dataset_metadata"]
+                rows = data["data"][1:]
+                result_columns = data["data"][0]
+                num_rows = len(rows)
+                pages.append(_rows_to_page(rows, result_columns))
+            else:
+                # csv responses carry no pagination metadata, so they are
+                # treated as a single page
+                meta = {}
+                content = response.content
+                if page > 1:
+                    # every page repeats the header line; keep only the
+                    # first page's
+                    content = content[content.index(b"\n") + 1 :]
+                num_rows = content.count(b"\n")
+                if content and not content.endswith(b"\n"):
+                    num_rows += 1
+                if page == 1:
+                    # don't count the header line
+                    num_rows -= 1
+                csv_chunks.append(content)
+
             has_next_page = meta.get("hasNextPage", False)
             # Extract the cursor to send in the next request for cursor pagination
             cursor = meta.get("cursor")
 
-            total_rows += len(df)
+            total_rows += num_rows
 
-            dfs.append(df)
+            if (
+                pipeline_queue is None
+                and not use_cursor_pagination
+                and has_next_page
+                and meta.get("totalPages")
+            ):
+                pipeline_queue = queue.Queue(maxsize=4)
+                threading.Thread(
+                    target=produce_pages,
+                    args=(page + 1, meta["totalPages"]),
+                    daemon=True,
+                ).start()
 
             response_time = time.time() - start_time
             total_time += response_time
@@ -410,16 +899,54 @@ class GridStatusClient:
                 log(f"Total rows: {total_rows:,}/{limit:,} ({pct}% of limit)", verbose)
 
             page += 1
-            time.sleep(sleep_time)
+            if pipeline_queue is None and sleep_time:
+                # When pipelined, the producer thread handles sleep_time
+                time.sleep(sleep_time)
 
         log("", verbose=verbose)  # Add a newline for cleaner output
 
-        df = pd.concat(dfs).reset_index(drop=True)
+        if request_format == "json":
+            df = _pages_to_dataframe(pages, result_columns)
+        else:
+            # Parse all pages in one pass
+            content = b"".join(csv_chunks)
+            csv_chunks.clear()
+            df = _read_csv(content, dtype_backend=dtype_backend)
 
         # Print the additional information
         log(f"Total number of rows: {len(df)}", verbose=verbose)
 
-        all_columns = dataset_metadata.get("all_columns", [])
+        df = self._handle_date_columns(df, dataset_metadata, tz, timezone)
+
+        if dtype_backend is not None:
+            df = df.convert_dtypes(dtype_backend=dtype_backend)
+
+        if use_categories:
+            df = self._convert_to_categories(df)
+
+        return df
+
+    def _convert_to_categories(self, df):
+        """Convert string columns with repeated values to categoricals,
+        which store each distinct value once"""
+        for col_name in df.columns:
+            col = df[col_name]
+            # is_string_dtype covers object, pandas "str", and Arrow-backed
+            # string columns; categoricals are already converted
+            if isinstance(col.dtype, pd.CategoricalDtype):
+                continue
+            if pd.api.types.is_string_dtype(col) and (
+                0 < col.nunique() <= max(1, len(col) // 2)
+            ):
+                df[col_name] = col.astype("category")
+        return df
+
+    def _handle_date_columns(self, df, dataset_metadata, tz, timezone):
+        """Parse datetime columns in UTC and, if a timezone is provided,
+        convert them to local time."""
+        # csv responses don't include dataset metadata; the well-known
+        # datetime columns below are still handled
+        all_columns = (dataset_metadata or {}).get("all_columns", [])
 
         # These are columns that are always datetimes. In some situations, we will
         # add these columns to a dataset even if they are not in the dataset metadata,
@@ -429,18 +956,35 @@ class GridStatusClient:
             "interval_end_utc",
         ]
 
+        # Look up column metadata by name once instead of scanning
+        # all_columns for every column in the dataframe
+        columns_by_name = {col["name"]: col for col in all_columns}
+
+        # Collect renames and apply them in one df.rename at the end instead
+        # of copying the frame once per renamed column
+        renames = {}
+
         for col_name in df.columns:
-            col_metadata = next(
-                (col for col in all_columns if col["name"] == col_name),
-                None,
-            )
+            col_metadata = columns_by_name.get(col_name)
 
             if (col_metadata and col_metadata["is_datetime"]) or (
                 col_name in always_datetime_columns
             ):
                 # We need to parse all datetime columns in UTC before converting to
-                # local columns because only UTC can handle DST changes.
-                df[col_name] = pd.to_datetime(df[col_name], utc=True)
+                # local columns because only UTC can handle DST changes. Skip
+                # the parse when the column was already typed as a datetime
+                # (dtype kind "M" covers both numpy and Arrow-backed
+                # timestamps), e.g. by pyarrow's CSV reader. The API returns
+                # ISO 8601 timestamps, so passing format= skips pandas'
+                # per-value format inference.
+                if df[col_name].dtype.kind != "M":
+                    df[col_name] = pd.to_datetime(
+                        df[col_name],
+                        utc=True,
+                        format="ISO8601",
+                    )
+                elif df[col_name].dt.tz is None:
+                    df[col_name] = df[col_name].dt.tz_localize("UTC")
 
                 # TODO: remove old behavior
                 # If timezone is provided, returned data will have both local columns
@@ -451,9 +995,312 @@ class GridStatusClient:
                     df[col_name] = df[col_name].dt.tz_convert(timezone or tz)
 
                     if tz:
-                        df = df.rename(
-                            columns={col_name: col_name.replace("_utc", "") + "_local"},
-                        )
+                        renames[col_name] = col_name.replace("_utc", "") + "_local"
+
+        if renames:
+            df = df.rename(columns=renames)
+
+        return df
+
+    async def aget_dataset(
+        self,
+        dataset,
+        start=None,
+        end=None,
+        columns=None,
+        filter_column=None,
+        filter_value=None,
+        filter_operator="=",
+        publish_time=None,
+        resample=None,
+        resample_by=None,
+        resample_function="mean",
+        limit=None,
+        page_size=None,
+        tz=None,
+        timezone=None,
+        verbose=True,
+        use_cursor_pagination=False,
+        use_categories=False,
+        dtype_backend=None,
+        max_concurrency=10,
+    ):
+        """Get a dataset from the GridStatus.io API, fetching pages concurrently
+
+        Accepts the same parameters as `get_dataset`, but when the server uses
+        page-based pagination, pages after the first are fetched concurrently
+        with aiohttp instead of one at a time. This can significantly reduce
+        wall-clock time for large multi-page requests.
+
+        Fetching pages concurrently requires the `aiohttp` package, which can
+        be installed with `pip install gridstatusio[async]`.
+
+        Parameters:
+            max_concurrency (int): The maximum number of pages to fetch
+                at the same time. Defaults to 10.
+
+            use_cursor_pagination (bool): If set to True, falls back to
+                fetching pages serially in a worker thread, since cursor
+                pagination requires each page's cursor to fetch the next.
+                Defaults to False.
+
+        See `get_dataset` for documentation of the remaining parameters.
+
+        Returns:
+            pd.DataFrame: The dataset as a pandas dataframe
+        """
+        if use_cursor_pagination:
+            # Cursor pagination is inherently serial since each page's cursor
+            # is needed to request the next page
+            return await asyncio.to_thread(
+                self.get_dataset,
+                dataset,
+                start=start,
+                end=end,
+                columns=columns,
+                filter_column=filter_column,
+                filter_value=filter_value,
+                filter_operator=filter_operator,
+                publish_time=publish_time,
+                resample=resample,
+                resample_by=resample_by,
+                resample_function=resample_function,
+                limit=limit,
+                page_size=page_size,
+                tz=tz,
+                timezone=timezone,
+                verbose=verbose,
+                use_cursor_pagination=True,
+                use_categories=use_categories,
+                dtype_backend=dtype_backend,
+            )
+
+        if tz:
+            warnings.warn(
+                "The 'tz' parameter is deprecated. Please use 'timezone' instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            if timezone:
+                raise ValueError("'tz' and 'timezone' parameters cannot both be set.")
+
+        if start is not None:
+            start = utils.handle_date(start, tz)
+
+        if end is not None:
+            end = utils.handle_date(end, tz)
+
+        url = f"{self.host}/datasets/{dataset}/query"
+
+        # Everything but the page number is the same for all pages, so
+        # serialize the params once and copy them per request
+        base_params = self._build_dataset_params(
+            start=start,
+            end=end,
+            columns=columns,
+            filter_column=filter_column,
+            filter_value=filter_value,
+            filter_operator=filter_operator,
+            publish_time=publish_time,
+            resample=resample,
+            resample_by=resample_by,
+            resample_function=resample_function,
+            limit=limit,
+            page_size=page_size,
+            timezone=timezone,
+            page=None,
+        )
+
+        def build_params(page):
+            params = base_params.copy()
+            params["page"] = page
+            return params
+
+        use_raw_rows = self.request_format == "json"
+
+        # Fetch the first page with the regular client to learn the total
+        # number of pages before fanning out
+        log("Fetching Page 1...", verbose, end="")
+        start_time = time.time()
+        pages = []
+        result_columns = None
+        csv_chunks = []
+        if use_raw_rows:
+            rows, result_columns, meta, dataset_metadata = await asyncio.to_thread(
+                self.get,
+                url,
+                build_params(page=1),
+                verbose,
+                raw=True,
+            )
+            pages.append(_rows_to_page(rows, result_columns))
+        else:
+            content, meta, dataset_metadata = await asyncio.to_thread(
+                self.get,
+                url,
+                build_params(page=1),
+                verbose,
+                raw=True,
+            )
+            csv_chunks.append(content)
+            # csv responses carry no pagination metadata, so they are
+            # treated as a single page, same as get_dataset
+            meta = {}
+        log(f"Done in {round(time.time() - start_time, 2)} seconds. ", verbose)
+
+        total_pages = meta.get("totalPages")
+        if total_pages is None and limit and page_size:
+            total_pages = math.ceil(limit / page_size)
+
+        if meta.get("hasNextPage", False) and not total_pages:
+            # We cannot pre-compute the page count, so fetch the remaining
+            # pages serially
+            page = 2
+            has_next_page = True
+            while has_next_page:
+                log(f"Fetching Page {page}...", verbose, end="")
+                start_time = time.time()
+                if use_raw_rows:
+                    (
+                        rows,
+                        result_columns,
+                        meta,
+                        dataset_metadata,
+                    ) = await asyncio.to_thread(
+                        self.get,
+                        url,
+                        build_params(page=page),
+                        verbose,
+                        raw=True,
+                    )
+                    pages.append(_rows_to_page(rows, result_columns))
+                else:
+                    content, meta, dataset_metadata = await asyncio.to_thread(
+                        self.get,
+                        url,
+                        build_params(page=page),
+                        verbose,
+                        raw=True,
+                    )
+                    # every page repeats the header line; keep only the
+                    # first page's
+                    csv_chunks.append(content[content.index(b"\n") + 1 :])
+                    meta = {}
+                log(f"Done in {round(time.time() - start_time, 2)} seconds. ", verbose)
+                has_next_page = meta.get("hasNextPage", False)
+                page += 1
+        elif meta.get("hasNextPage", False) and total_pages and total_pages > 1:
+            # The page count derived from limit/page_size can overshoot what
+            # the query actually returns, so only fan out when the first page
+            # says more data exists
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError(
+                    "aiohttp is required to fetch pages concurrently with "
+                    "aget_dataset. Install it with "
+                    "`pip install gridstatusio[async]`.",
+                )
+
+            semaphore = asyncio.Semaphore(max_concurrency)
+            headers = self._headers()
+
+            async def fetch_page(session, page):
+                # aiohttp does not drop None-valued params like requests does
+                params = {
+                    k: str(v)
+                    for k, v in build_params(page=page).items()
+                    if v is not None
+                }
+                params["return_format"] = "json"
+                params["json_schema"] = "array-of-arrays"
+
+                retries = 0
+                initial_delay = 1
+                async with semaphore:
+                    while True:
+                        wait = self._reserve_request_slot()
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                        async with session.get(
+                            url,
+                            params=params,
+                            headers=headers,
+                        ) as response:
+                            if response.status == 200:
+                                data = _parse_json(await response.read())
+                                break
+                            elif (response.status == 429) and (
+                                retries == self.max_retries
+                            ):
+                                raise Exception(
+                                    "Rate limited. "
+                                    "Exceeded maximum number of retries",
+                                )
+                            elif response.status == 429:
+                                delay = self._retry_delay(
+                                    response,
+                                    retries,
+                                    initial_delay,
+                                )
+                                retries += 1
+                                log(
+                                    (
+                                        f"API rate limit hit. Retrying again in "
+                                        f"{delay} seconds. Retry {retries} of "
+                                        f"{self.max_retries}."
+                                    ),
+                                    verbose=verbose,
+                                    level="info",
+                                )
+                                await asyncio.sleep(delay)
+                            else:
+                                raise Exception(
+                                    f"Error {response.status}: "
+                                    f"{await response.text()}",
+                                )
+
+                log(f"Fetched Page {page}", verbose)
+                # Convert to an Arrow table here so the page's Python row
+                # objects are released as soon as it is parsed, not held
+                # until every concurrent page has finished
+                rows = data["data"][1:]
+                page_columns = data["data"][0]
+                return _rows_to_page(rows, page_columns), page_columns
+
+            log(
+                f"Fetching Pages 2-{total_pages} "
+                f"({max_concurrency} pages at a time)...",
+                verbose,
+            )
+            start_time = time.time()
+            connector = aiohttp.TCPConnector(limit_per_host=64)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                # gather preserves input order, so pages are reassembled
+                # in page order
+                fetched_pages = await asyncio.gather(
+                    *[fetch_page(session, page) for page in range(2, total_pages + 1)],
+                )
+            for fetched_page, result_columns in fetched_pages:
+                pages.append(fetched_page)
+            log(f"Done in {round(time.time() - start_time, 2)} seconds. ", verbose)
+
+        if use_raw_rows:
+            df = _pages_to_dataframe(pages, result_columns)
+        else:
+            content = b"".join(csv_chunks)
+            csv_chunks.clear()
+            df = _read_csv(content, dtype_backend=dtype_backend)
+
+        log(f"Total number of rows: {len(df)}", verbose=verbose)
+
+        df = self._handle_date_columns(df, dataset_metadata, tz, timezone)
+
+        if dtype_backend is not None:
+            df = df.convert_dtypes(dtype_backend=dtype_backend)
+
+        if use_categories:
+            df = self._convert_to_categories(df)
 
         return df
 
@@ -1032,9 +1032,10 @@ def test_invalid_resampling_frequency():
         )
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_rate_limit_hit_backoff(mock_get_request, capsys):
     mock_get_request.return_value.status_code = 429
+    mock_get_request.return_value.headers = {}
     with pytest.raises(
         Exception,
         match="Rate limited. Exceeded maximum number of retries",
@@ -0,0 +1,329 @@
+"""Offline unit tests for the client's request handling.
+
+Unlike test_api.py, these tests mock out the HTTP session, so they don't
+need an API key or network access.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+import gridstatusio as gs
+
+
+def _response(payload, status_code=200, headers=None):
+    """Build a mock response carrying a JSON payload"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(payload).encode()
+    response.headers = headers or {}
+    return response
+
+
+def _dataset_payload(has_next_page=False, total_pages=None):
+    meta = {"hasNextPage": has_next_page}
+    if total_pages is not None:
+        meta["totalPages"] = total_pages
+    return {
+        "data": [
+            ["interval_start_utc", "interval_end_utc", "load"],
+            ["2024-01-01T00:00:00+00:00", "2024-01-01T01:00:00+00:00", 100],
+            ["2024-01-01T01:00:00+00:00", "2024-01-01T02:00:00+00:00", 200],
+        ],
+        "meta": meta,
+        "dataset_metadata": {"all_columns": []},
+    }
+
+
+def _client(**kwargs):
+    return gs.GridStatusClient(api_key="test", **kwargs)
+
+
+def test_build_dataset_params_joins_lists():
+    client = _client()
+    params = client._build_dataset_params(
+        start=None,
+        end=None,
+        columns=["interval_start_utc", "load"],
+        filter_column="fuel",
+        filter_value=["wind", "solar"],
+        filter_operator="in",
+        publish_time=None,
+        resample="1 hour",
+        resample_by=["fuel", "location"],
+        resample_function="mean",
+        limit=100,
+        page_size=50,
+        timezone=None,
+        page=1,
+    )
+    assert params["columns"] == "interval_start_utc,load"
+    assert params["filter_value"] == "wind,solar"
+    assert params["filter_operator"] == "in"
+    assert params["resample_by"] == "fuel,location"
+    assert params["resample_function"] == "mean"
+    assert params["limit"] == 100
+    assert params["page"] == 1
+
+
+def test_build_dataset_params_no_resample():
+    client = _client()
+    params = client._build_dataset_params(
+        start=None,
+        end=None,
+        columns=None,
+        filter_column=None,
+        filter_value=None,
+        filter_operator="=",
+        publish_time=None,
+        resample=None,
+        resample_by=None,
+        resample_function="mean",
+        limit=None,
+        page_size=None,
+        timezone=None,
+        page=None,
+    )
+    # resample_function only applies when resampling
+    assert params["resample_function"] is None
+    assert params["resample_by"] is None
+    assert "columns" not in params
+
+
+@patch("requests.Session.get")
+def test_aget_dataset_single_page_no_fan_out(mock_get):
+    # The page count derived from limit/page_size overshoots here (2 pages),
+    # but the first page says there is no more data, so no extra requests
+    # should be made
+    mock_get.return_value = _response(_dataset_payload(has_next_page=False))
+
+    client = _client()
+    df = asyncio.run(
+        client.aget_dataset(
+            "isone_fuel_mix",
+            limit=200,
+            page_size=100,
+            verbose=False,
+        ),
+    )
+
+    assert mock_get.call_count == 1
+    assert len(df) == 2
+    assert list(df.columns) == ["interval_start_utc", "interval_end_utc", "load"]
+
+
+def test_reserve_request_slot_spaces_requests():
+    client = _client(max_requests_per_second=10)
+    # The first slot is immediately available; later slots are spaced
+    # one interval apart
+    assert client._reserve_request_slot() == 0
+    wait = client._reserve_request_slot()
+    assert 0 < wait <= 0.1
+    wait = client._reserve_request_slot()
+    assert 0.1 < wait <= 0.2
+
+
+def test_reserve_request_slot_disabled_by_default():
+    client = _client()
+    assert client._reserve_request_slot() == 0
+    assert client._reserve_request_slot() == 0
+
+
+def _catalog_payload():
+    return {
+        "data": [
+            [
+                "id",
+                "name",
+                "description",
+                "earliest_available_time",
+                "latest_available_time",
+            ],
+            [
+                "isone_fuel_mix",
+                "ISONE Fuel Mix",
+                "Fuel mix",
+                "2020-01-01",
+                "2024-01-01",
+            ],
+        ],
+        "meta": {},
+        "dataset_metadata": None,
+    }
+
+
+@patch("requests.Session.get")
+def test_catalog_cache_serves_repeated_calls(mock_get):
+    mock_get.return_value = _response(_catalog_payload())
+
+    client = _client()
+    first = client.list_datasets(return_list=True)
+    second = client.list_datasets(return_list=True)
+
+    assert mock_get.call_count == 1
+    assert first == second
+    assert first[0]["id"] == "isone_fuel_mix"
+
+
+@patch("requests.Session.get")
+def test_catalog_cache_disabled_with_zero_ttl(mock_get):
+    mock_get.return_value = _response(_catalog_payload())
+
+    client = _client(catalog_cache_ttl=0)
+    client.list_datasets(return_list=True)
+    client.list_datasets(return_list=True)
+
+    assert mock_get.call_count == 2
+
+
+def test_retry_delay_honors_retry_after_header():
+    client = _client()
+    response = MagicMock()
+    response.headers = {"Retry-After": "2.5"}
+    assert client._retry_delay(response, retries=0) == 2.5
+    # Retry-After wins regardless of the retry count
+    assert client._retry_delay(response, retries=3) == 2.5
+
+
+def test_retry_delay_falls_back_to_exponential_backoff():
+    client = _client()
+    response = MagicMock()
+    response.headers = {}
+    assert client._retry_delay(response, retries=0) == 1
+    assert client._retry_delay(response, retries=1) == 2
+    assert client._retry_delay(response, retries=2) == 4
+
+    # An HTTP-date Retry-After is not parsed; fall back to backoff
+    response.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert client._retry_delay(response, retries=1) == 2
+
+
+@patch("requests.Session.get")
+def test_catalog_cache_revalidates_with_etag(mock_get):
+    full_response = _response(_catalog_payload(), headers={"ETag": 'W/"abc"'})
+    not_modified = _response({}, status_code=304)
+    mock_get.side_effect = [full_response, not_modified]
+
+    client = _client(catalog_cache_ttl=0)
+    first = client.list_datasets(return_list=True)
+    second = client.list_datasets(return_list=True)
+
+    assert mock_get.call_count == 2
+    sent_headers = mock_get.call_args_list[1].kwargs["headers"]
+    assert sent_headers["If-None-Match"] == 'W/"abc"'
+    # The 304 has no body; the cached copy is served
+    assert first == second
+
+
+@patch("requests.Session.get")
+def test_catalog_cache_stale_fallback_when_unreachable(mock_get):
+    mock_get.side_effect = [
+        _response(_catalog_payload()),
+        requests.exceptions.ConnectionError("nope"),
+    ]
+
+    client = _client(catalog_cache_ttl=0)
+    first = client.list_datasets(return_list=True)
+    with pytest.warns(UserWarning, match="previously cached copy"):
+        second = client.list_datasets(return_list=True)
+
+    assert mock_get.call_count == 2
+    assert first == second
+
+
+@patch("requests.Session.get")
+def test_catalog_fetch_fails_without_cached_copy(mock_get):
+    mock_get.side_effect = requests.exceptions.ConnectionError("nope")
+
+    client = _client()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.list_datasets(return_list=True)
+
+
+def test_convert_to_categories():
+    import pandas as pd
+
+    client = _client()
+    df = pd.DataFrame(
+        {
+            "fuel": ["wind", "solar", "wind", "solar"],
+            "unique": ["a", "b", "c", "d"],
+            "load": [1, 2, 3, 4],
+        },
+    )
+    df = client._convert_to_categories(df)
+
+    assert isinstance(df["fuel"].dtype, pd.CategoricalDtype)
+    # columns with no repeated values aren't worth converting
+    assert not isinstance(df["unique"].dtype, pd.CategoricalDtype)
+    assert not isinstance(df["load"].dtype, pd.CategoricalDtype)
+
+
+@patch("requests.Session.get")
+def test_get_dataset_multiple_pages(mock_get):
+    mock_get.side_effect = [
+        _response(_dataset_payload(has_next_page=True, total_pages=2)),
+        _response(_dataset_payload(has_next_page=False, total_pages=2)),
+    ]
+
+    client = _client()
+    df = client.get_dataset(
+        "isone_fuel_mix",
+        verbose=False,
+        use_cursor_pagination=False,
+    )
+
+    assert mock_get.call_count == 2
+    assert len(df) == 4
+    assert df["load"].tolist() == [100, 200, 100, 200]
+
+
+def test_pages_to_dataframe_mixed_arrow_and_rows():
+    from gridstatusio.gs_client import _pages_to_dataframe, _rows_to_page
+
+    columns = ["a", "b"]
+    arrow_page = _rows_to_page([[1, "x"], [2, "y"]], columns)
+    # a column mixing ints and strings can't be typed by pyarrow, so the
+    # raw rows are kept and padded into the result by pandas
+    fallback_page = _rows_to_page([[3, "z"], ["oops", "w"]], columns)
+    assert isinstance(fallback_page, list)
+
+    df = _pages_to_dataframe([arrow_page, fallback_page], columns)
+    assert df["a"].tolist() == [1, 2, 3, "oops"]
+    assert df["b"].tolist() == ["x", "y", "z", "w"]
+
+
+@patch("requests.Session.get")
+def test_get_dataset_stale_total_pages(mock_get):
+    # The dataset grew between page 1 and the last page, so the page count
+    # reported by page 1 is stale and the last produced page still reports
+    # hasNextPage. The pipeline must hand back control instead of blocking
+    # on pages that were never scheduled.
+    mock_get.side_effect = [
+        _response(_dataset_payload(has_next_page=True, total_pages=2)),
+        _response(_dataset_payload(has_next_page=True, total_pages=2)),
+        _response(_dataset_payload(has_next_page=False)),
+    ]
+
+    client = _client()
+    df = client.get_dataset(
+        "isone_fuel_mix",
+        verbose=False,
+        use_cursor_pagination=False,
+    )
+
+    assert mock_get.call_count == 3
+    assert len(df) == 6
+
+
+def test_use_http2_enables_http2_transport():
+    httpx = pytest.importorskip("httpx")
+
+    client = _client(use_http2=True)
+    assert isinstance(client.session, httpx.Client)
+    # An explicit transport ignores the client-level http2 flag, so check
+    # the flag made it down to the connection pool
+    assert client.session._transport._pool._http2 is True